@@ -22,7 +22,7 @@ Architecture:
 Dependencies:
 - nltk: Natural Language Toolkit for text processing
 - sklearn: Machine learning for TF-IDF and similarity calculations
-- json: Dataset loading and management
+- orjson: Fast dataset loading
 - chromadb: Vector database for semantic search and RAG
 """
 
@@ -31,8 +31,8 @@ from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import json
+import numpy as np
+import functools
 import os
 
 # Fix for Protobuf Descriptor error when importing chromadb with newer protobuf versions
@@ -61,6 +61,10 @@ except LookupError:
 from typing import List, Dict, Tuple, Optional, Any
 
 from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+from assistant.core.json_utils import read_json_file
+from assistant.core.logger import get_logger
+
+logger = get_logger("Model")
 
 # Global ChromaDB client
 _chroma_client = None
@@ -100,12 +104,12 @@ def init_chroma(db_path: str):
                 embedding_function=emb_fn
             )
 
+
 def load_dataset(file_path: str) -> List[Dict[str, str]]:
     """
     Load and parse the Q&A dataset from a JSON file.
     """
-    with open(file_path, "r", encoding="utf-8") as file:
-        qa_dict = json.load(file)
+    qa_dict = read_json_file(file_path)
     dataset = [{"question": q, "answer": a} for q, a in qa_dict.items()]
     return dataset
 
@@ -138,22 +142,81 @@ def train_tfidf_vectorizer(dataset: List[Dict[str, str]]) -> Tuple[TfidfVectoriz
     return vectorizer, X
 
 
+def _sparse_best_match(data, indices, indptr, n_rows, q_idx, q_val):
+    """
+    Score every dataset row against a sparse query and return the best one.
+
+    Walks only the CSC columns of the query's terms, accumulating into a dense
+    score vector, so the cost is proportional to the rows touched by the query.
+    Only run once compiled by ``_sparse_best_match_kernel``.
+    """
+    scores = np.zeros(n_rows)
+    for k in range(q_idx.size):
+        col = q_idx[k]
+        weight = q_val[k]
+        for p in range(indptr[col], indptr[col + 1]):
+            scores[indices[p]] += weight * data[p]
+
+    best_row = 0
+    for i in range(n_rows):
+        if scores[i] > scores[best_row]:
+            best_row = i
+    return best_row, scores[best_row]
+
+
+@functools.lru_cache(maxsize=1)
+def _sparse_best_match_kernel():
+    """
+    Compile ``_sparse_best_match`` with numba on first use, or return None without numba.
+
+    numba is optional and slow to import, so it is only loaded when the model
+    is first loaded rather than on import.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True, fastmath=True)(_sparse_best_match)
+
+
+def _best_match(question_vec: Any, X: Any) -> Tuple[int, float]:
+    """
+    Locate the dataset row most similar to an already vectorized question.
+
+    TfidfVectorizer L2-normalizes every row, so the sparse dot product is the
+    cosine similarity. Only rows sharing a term with the question are stored in
+    the (1, N) result, which avoids materializing a dense similarity array.
+    """
+    kernel = _sparse_best_match_kernel() if X.format == "csc" and question_vec.nnz else None
+    if kernel is not None:
+        best_row, best_score = kernel(
+            X.data, X.indices, X.indptr, X.shape[0], question_vec.indices, question_vec.data
+        )
+        return int(best_row), float(best_score)
+
+    scores = question_vec @ X.T
+    if scores.nnz == 0:
+        return 0, 0.0
+    # Sorted indices keep ties resolving to the earliest dataset row
+    scores.sort_indices()
+    best_pos = scores.data.argmax()
+    return int(scores.indices[best_pos]), float(scores.data[best_pos])
+
+
 def get_answer(question: str, vectorizer: TfidfVectorizer, X: Any, dataset: List[Dict[str, str]], threshold: float = 0.5) -> Tuple[Optional[str], float]:
     """
     Find the best matching answer for a user question using cosine similarity.
     """
     processed_question = preprocess_text(question)
     question_vec = vectorizer.transform([processed_question])
-    similarities = cosine_similarity(question_vec, X)
-    
-    best_match_index = similarities.argmax()
-    best_similarity = similarities[0][best_match_index]
+    best_match_index, best_similarity = _best_match(question_vec, X)
 
     if best_similarity > threshold:
         matched_q = dataset[best_match_index]['question']
         len_q = len(processed_question.split())
         len_m = len(preprocess_text(matched_q).split())
-        
+        ratio = 0.0
+
         # Protect against OOV collapse (where unknown words are stripped, leaving a 100% match on a single word)
         if len_q > 0 and len_m > 0:
             ratio = min(len_q, len_m) / max(len_q, len_m)
@@ -161,7 +224,7 @@ def get_answer(question: str, vectorizer: TfidfVectorizer, X: Any, dataset: List
                 return dataset[best_match_index]["answer"], best_similarity
                 
         # If ratio is too low, reject the false positive
-        print(f"Rejected false positive due to length mismatch: '{matched_q}' (Ratio: {ratio:.2f})")
+        logger.debug("Rejected false positive due to length mismatch: '%s' (Ratio: %.2f)", matched_q, ratio)
         return None, best_similarity
     else:
         return None, best_similarity
@@ -205,6 +268,10 @@ def ensure_model_loaded(dataset_path: str) -> None:
             except Exception as e:
                 print(f"Failed to save TF-IDF cache: {e}")
 
+        if _sparse_best_match_kernel() is not None:
+            # Column-major layout lets the JIT kernel gather only the query's terms
+            _cached_matrix = _cached_matrix.tocsc()
+
         _last_mtime = current_mtime
         
         # Differential Sync with ChromaDB to eliminate inference delay
@@ -336,10 +403,10 @@ def mind(text: str, threshold: float = 0.7, return_rag: bool = False) -> Optiona
     ensure_model_loaded(dataset_path)
 
     answer, similarity = get_answer(text, _cached_vectorizer, _cached_matrix, _cached_dataset, threshold)
-    print(f"TF-IDF Answer: {answer}, Similarity: {similarity}, Threshold: {threshold}")
+    logger.debug("TF-IDF answer: %s, similarity: %.4f, threshold: %s", answer, similarity, threshold)
     if answer and similarity >= 0.95:
         # High confidence exact match from TF-IDF
-        print("Returning TF-IDF exact match.")
+        logger.debug("Returning TF-IDF exact match.")
         return answer
         
     # ChromaDB Semantic Similarity / RAG Fallback
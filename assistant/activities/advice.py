@@ -7,6 +7,9 @@ import random
 import time
 from typing import Optional
 from assistant.core.speak_selector import speak
+from assistant.core.logger import get_logger
+
+logger = get_logger("Advice")
 
 # Cache to store recent advice to avoid repeated API calls
 advice_cache = []
@@ -111,17 +114,17 @@ def rand_advice() -> Optional[str]:
                         advice_cache.pop(0)
                     advice_cache.append(advice)
                     LAST_API_CALL = current_time
-                    print(f"Successfully fetched advice from {future_to_api[future]}")
+                    logger.debug("Successfully fetched advice from %s", future_to_api[future])
                     executor.shutdown(wait=False, cancel_futures=True)
                     return advice
             except Exception:
                 continue  # If one API fails, try the next one
     except concurrent.futures.TimeoutError:
-        print("Advice APIs timed out")
+        logger.warning("Advice APIs timed out")
 
     executor.shutdown(wait=False, cancel_futures=True)
     # If all APIs fail, use local fallback advice
-    print("All advice APIs failed, using local fallback")
+    logger.info("All advice APIs failed, using local fallback")
     return random.choice(fallback_advice)
 
 
@@ -3,7 +3,9 @@ Module for monitoring system battery status and hardware telemetry.
 Provides background threads for voice alerts, state change detection, and system metrics.
 """
 
+import ctypes
 import psutil
+import sys
 import time
 import random
 import threading
@@ -11,6 +13,167 @@ from typing import Optional
 from assistant.core.speak_selector import speak
 from data.dlg_data.dlg import last_low, low_b, full_battery, plug_in, plug_out
 from assistant.core.event_bus import bus, EventType
+from assistant.core.logger import get_logger
+
+logger = get_logger("Battery")
+
+
+# BATTERY_UPDATE feeds the web UI's battery widget. OS power events only cover
+# plug changes, so the percentage is still re-read and emitted this often
+BATTERY_UPDATE_INTERVAL = 5
+
+# Readings younger than this are reused instead of querying psutil again
+BATTERY_CACHE_TTL = 2.0
+
+# Voice line pools, frozen once so alerts pick from tuples via a bound chooser
+_choose = random.choice
+_LAST_LOW = tuple(last_low)
+_LOW_BATTERY = tuple(low_b)
+_FULL_BATTERY = tuple(full_battery)
+_PLUG_IN = tuple(plug_in)
+_PLUG_OUT = tuple(plug_out)
+
+# Win32 constants for power setting notifications
+_WM_POWERBROADCAST = 0x0218
+_HWND_MESSAGE = -3
+_DEVICE_NOTIFY_WINDOW_HANDLE = 0
+
+
+class PowerSource:
+    """
+    Wakes waiting threads when the OS reports a power supply change.
+
+    Listens to udev ``power_supply`` events on Linux (requires pyudev) and to
+    ``GUID_ACDC_POWER_SOURCE`` notifications on Windows. On other platforms,
+    or if the listener cannot be set up, ``available`` stays False and callers
+    fall back to their regular polling interval.
+    """
+
+    def __init__(self):
+        """Initializes the change condition without starting a listener."""
+        self.changed = threading.Condition()
+        self.available = False
+        self.events = 0
+        self._thread = None
+
+    def start(self) -> None:
+        """Starts the platform listener thread, once per process."""
+        if self._thread is not None:
+            return
+
+        if sys.platform.startswith("linux"):
+            target = self._listen_udev
+        elif sys.platform == "win32":
+            target = self._listen_win32
+        else:
+            return
+
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def notify(self) -> None:
+        """Records a power change and wakes every thread waiting on ``changed``."""
+        with self.changed:
+            self.events += 1
+            self.changed.notify_all()
+
+    def _listen_udev(self) -> None:
+        """Forwards udev power_supply events until the process exits."""
+        try:
+            import pyudev
+
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by("power_supply")
+            monitor.start()
+        except Exception as e:
+            logger.warning("Power event monitoring unavailable: %s", e)
+            return
+
+        self.available = True
+        for _device in iter(monitor.poll, None):
+            self.notify()
+
+    def _listen_win32(self) -> None:
+        """Runs a message-only window registered for AC/DC power source changes."""
+        from ctypes import wintypes
+
+        class GUID(ctypes.Structure):
+            _fields_ = [
+                ("Data1", wintypes.DWORD),
+                ("Data2", wintypes.WORD),
+                ("Data3", wintypes.WORD),
+                ("Data4", ctypes.c_ubyte * 8),
+            ]
+
+        LRESULT = ctypes.c_ssize_t
+        WNDPROC = ctypes.WINFUNCTYPE(LRESULT, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+
+        class WNDCLASSW(ctypes.Structure):
+            _fields_ = [
+                ("style", wintypes.UINT),
+                ("lpfnWndProc", WNDPROC),
+                ("cbClsExtra", ctypes.c_int),
+                ("cbWndExtra", ctypes.c_int),
+                ("hInstance", wintypes.HINSTANCE),
+                ("hIcon", wintypes.HICON),
+                ("hCursor", wintypes.HANDLE),
+                ("hbrBackground", wintypes.HBRUSH),
+                ("lpszMenuName", wintypes.LPCWSTR),
+                ("lpszClassName", wintypes.LPCWSTR),
+            ]
+
+        # Private DLL handles so the argtypes below don't leak into other ctypes users
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        user32.DefWindowProcW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+        user32.DefWindowProcW.restype = LRESULT
+        user32.CreateWindowExW.argtypes = [
+            wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+            wintypes.HWND, wintypes.HMENU, wintypes.HINSTANCE, wintypes.LPVOID,
+        ]
+        user32.CreateWindowExW.restype = wintypes.HWND
+        user32.RegisterPowerSettingNotification.argtypes = [wintypes.HANDLE, ctypes.POINTER(GUID), wintypes.DWORD]
+        user32.RegisterPowerSettingNotification.restype = wintypes.HANDLE
+        user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+        kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+
+        def wnd_proc(hwnd, msg, wparam, lparam):
+            if msg == _WM_POWERBROADCAST:
+                self.notify()
+                return 1
+            return user32.DefWindowProcW(hwnd, msg, wparam, lparam)
+
+        # Keep a reference to the callback for the lifetime of the window
+        self._wnd_proc = WNDPROC(wnd_proc)
+        class_name = "JarvisPowerSourceListener"
+        h_instance = kernel32.GetModuleHandleW(None)
+
+        window_class = WNDCLASSW()
+        window_class.lpfnWndProc = self._wnd_proc
+        window_class.hInstance = h_instance
+        window_class.lpszClassName = class_name
+
+        # GUID_ACDC_POWER_SOURCE {5D3E9A59-E9D5-4B00-A6BD-FF34FF516548}
+        acdc_guid = GUID(0x5D3E9A59, 0xE9D5, 0x4B00, (ctypes.c_ubyte * 8)(0xA6, 0xBD, 0xFF, 0x34, 0xFF, 0x51, 0x65, 0x48))
+
+        if not user32.RegisterClassW(ctypes.byref(window_class)):
+            logger.warning("Power event monitoring unavailable: RegisterClassW failed (%d)", ctypes.get_last_error())
+            return
+        hwnd = user32.CreateWindowExW(
+            0, class_name, class_name, 0, 0, 0, 0, 0, _HWND_MESSAGE, None, h_instance, None
+        )
+        if not hwnd or not user32.RegisterPowerSettingNotification(
+            hwnd, ctypes.byref(acdc_guid), _DEVICE_NOTIFY_WINDOW_HANDLE
+        ):
+            logger.warning("Power event monitoring unavailable: notification setup failed (%d)", ctypes.get_last_error())
+            return
+
+        self.available = True
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            user32.TranslateMessage(ctypes.byref(msg))
+            user32.DispatchMessageW(ctypes.byref(msg))
 
 
 class BatteryMonitor:
@@ -25,78 +188,92 @@ class BatteryMonitor:
         """Initializes the monitor with default state and thread control."""
         self.previous_plugged_state = None
         self.stop_event = threading.Event()
-        self.alert_thread = None
-        self.plugin_thread = None
+        self.monitor_thread = None
+        self.power_source = PowerSource()
+        self._lifecycle = threading.Lock()
+        self._battery_lock = threading.Lock()
+        self._battery_cache = None
+        self._battery_cache_time = float("-inf")
+        self._battery_cache_events = 0
 
     def get_battery_info(self) -> Optional[tuple]:
         """
         Retrieves current battery percentage and power status.
 
+        Readings are cached for ``BATTERY_CACHE_TTL`` seconds so that callers
+        polling close together share one psutil query. A reported power change
+        invalidates the cache immediately.
+
         Returns:
             Optional[tuple]: (percentage, power_plugged) or None if unavailable.
         """
-        try:
-            battery = psutil.sensors_battery()
-            if battery is None:
+        with self._battery_lock:
+            now = time.monotonic()
+            if (
+                now - self._battery_cache_time < BATTERY_CACHE_TTL
+                and self._battery_cache_events == self.power_source.events
+            ):
+                return self._battery_cache
+
+            try:
+                battery = psutil.sensors_battery()
+            except Exception as e:
+                logger.warning("Error getting battery info: %s", e)
                 return None
-            return int(battery.percent), battery.power_plugged
-        except Exception as e:
-            print(f"Error getting battery info: {e}")
-            return None
 
-    def battery_alert(self, check_interval: int = 300) -> None:
-        """
-        Monitors battery levels and triggers voice alerts for critical thresholds.
+            info = None if battery is None else (int(battery.percent), battery.power_plugged)
+            self._battery_cache = info
+            self._battery_cache_time = now
+            self._battery_cache_events = self.power_source.events
+            return info
 
-        Args:
-            check_interval (int): Seconds between checks.
+    def _wait_for_power_change(self, timeout: float, seen_events: int, stop_event: threading.Event) -> bool:
         """
-        self.stop_event.clear()
-        
-        # Initialize silently to prevent immediate blast on boot
-        battery_info = self.get_battery_info()
-        notified_full = (battery_info is not None and battery_info[0] == 100 and battery_info[1])
-
-        while not self.stop_event.is_set():
-            battery_info = self.get_battery_info()
-            if battery_info is None:
-                if self.stop_event.wait(60):
-                    break
-                continue
+        Blocks until the OS reports a power change, monitoring stops, or the timeout expires.
 
-            percent, plugged = battery_info
-            bus.emit(EventType.BATTERY_UPDATE, {"percent": percent, "plugged": plugged})
+        Args:
+            timeout (float): Longest time to wait, in seconds.
+            seen_events (int): ``power_source.events`` as of the last reading. A
+                change reported since then returns immediately instead of being
+                missed while nobody was waiting.
+            stop_event (threading.Event): Stop signal of the calling worker.
 
-            if percent < 10:
-                speak(random.choice(last_low))
-            elif percent < 30:
-                speak(random.choice(low_b))
-            elif percent == 100 and plugged and not notified_full:
-                speak(random.choice(full_battery))
-                notified_full = True
-            elif percent < 95:
-                notified_full = False
-
-            if self.stop_event.wait(check_interval):
-                break
+        Returns:
+            bool: True if monitoring has been stopped.
+        """
+        source = self.power_source
+        with source.changed:
+            source.changed.wait_for(
+                lambda: source.events != seen_events or stop_event.is_set(), timeout
+            )
+        return stop_event.is_set()
 
-    def check_plugin_status(self, check_interval: int = 5) -> None:
+    def _monitor_loop(self, stop_event: threading.Event, alert_interval: int = 300, plug_interval: int = BATTERY_UPDATE_INTERVAL) -> None:
         """
-        Monitors power connection status and triggers voice alerts on changes.
+        Monitors power connection changes and battery levels from a single thread.
+
+        Each tick reads the battery once, announces plug state changes immediately,
+        and voices tiered battery alerts at most once per ``alert_interval``.
 
         Args:
-            check_interval (int): Seconds between checks.
+            stop_event (threading.Event): Stop signal for this run of the loop.
+            alert_interval (int): Seconds between battery level alerts.
+            plug_interval (int): Seconds between power status checks. OS power
+                events wake the loop early.
         """
-        self.stop_event.clear()
-
+        # Initialize silently to prevent immediate blast on boot
         battery_info = self.get_battery_info()
+        notified_full = (battery_info is not None and battery_info[0] == 100 and battery_info[1])
         if battery_info:
             self.previous_plugged_state = battery_info[1]
+        next_alert = time.monotonic()
 
-        while not self.stop_event.is_set():
+        while not stop_event.is_set():
+            # Taken before reading so a change during this tick is not slept through
+            seen_events = self.power_source.events
             battery_info = self.get_battery_info()
             if battery_info is None:
-                if self.stop_event.wait(check_interval):
+                if stop_event.wait(60):
                     break
                 continue
 
@@ -105,12 +282,25 @@ class BatteryMonitor:
 
             if plugged != self.previous_plugged_state:
                 if plugged:
-                    speak(random.choice(plug_in))
+                    speak(_choose(_PLUG_IN))
                 else:
-                    speak(random.choice(plug_out))
+                    speak(_choose(_PLUG_OUT))
                 self.previous_plugged_state = plugged
 
-            if self.stop_event.wait(check_interval):
+            now = time.monotonic()
+            if now >= next_alert:
+                if percent < 10:
+                    speak(_choose(_LAST_LOW))
+                elif percent < 30:
+                    speak(_choose(_LOW_BATTERY))
+                elif percent == 100 and plugged and not notified_full:
+                    speak(_choose(_FULL_BATTERY))
+                    notified_full = True
+                elif percent < 95:
+                    notified_full = False
+                next_alert = now + alert_interval
+
+            if self._wait_for_power_change(min(plug_interval, next_alert - now), seen_events, stop_event):
                 break
 
     def battery_percentage(self) -> None:
@@ -126,36 +316,47 @@ class BatteryMonitor:
             speak("Sorry, I couldn't retrieve the battery information.")
 
     def start_monitoring(self) -> None:
-        """Starts background threads for battery and telemetry monitoring."""
-        self.stop_monitoring()
+        """Starts the background battery monitoring thread."""
+        with self._lifecycle:
+            self._stop_threads()
 
-        self.stop_event.clear()
-        self.alert_thread = threading.Thread(target=self.battery_alert, daemon=True)
-        self.plugin_thread = threading.Thread(
-            target=self.check_plugin_status, daemon=True
-        )
-        self.alert_thread.start()
-        self.plugin_thread.start()
+            self.power_source.start()
+            # A fresh event per run: a worker that outlived the last stop's join
+            # keeps seeing its own event set and exits instead of being revived
+            self.stop_event = threading.Event()
+            self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(self.stop_event,), daemon=True)
+            self.monitor_thread.start()
         # Telemetry is now exclusively handled by server.py to prevent conflicts
-        print("Battery monitoring started")
+        logger.info("Battery monitoring started")
 
     def stop_monitoring(self) -> None:
         """Stops all background monitoring threads."""
+        with self._lifecycle:
+            self._stop_threads()
+        logger.info("Battery & Telemetry monitoring stopped")
+
+    def _stop_threads(self) -> None:
+        """Signals and joins the worker threads. Caller must hold ``_lifecycle``."""
         self.stop_event.set()
-        if self.alert_thread and self.alert_thread.is_alive():
-            self.alert_thread.join(timeout=2)
-        if self.plugin_thread and self.plugin_thread.is_alive():
-            self.plugin_thread.join(timeout=2)
+        self.power_source.notify()
+        # Workers wake on stop_event immediately; the timeout only covers one
+        # still inside a psutil query or an event bus handler
+        if self.monitor_thread and self.monitor_thread.is_alive():
+            self.monitor_thread.join(timeout=2)
+        self.monitor_thread = None
         if hasattr(self, 'telemetry_thread') and self.telemetry_thread and self.telemetry_thread.is_alive():
             self.telemetry_thread.join(timeout=2)
-        print("Battery & Telemetry monitoring stopped")
 
 
     def emit_telemetry(self) -> None:
-        """Continuously emits CPU and RAM metrics to the EventBus."""
-        self.stop_event.clear()
-        
-        while not self.stop_event.is_set():
+        """
+        Continuously emits CPU and RAM metrics to the EventBus.
+
+        Runs until the ``stop_event`` current when it started is set. Only
+        start_monitoring/stop_monitoring write the event; this worker just reads it.
+        """
+        stop_event = self.stop_event
+        while not stop_event.is_set():
             cpu = psutil.cpu_percent(interval=None)
             ram = psutil.virtual_memory().percent
             
@@ -164,7 +365,7 @@ class BatteryMonitor:
                 "ram": ram
             })
             
-            if self.stop_event.wait(2.0):
+            if stop_event.wait(2.0):
                 break
 
 battery_monitor = BatteryMonitor()
@@ -174,7 +375,10 @@ if __name__ == "__main__":
     battery_monitor.start_monitoring()
 
     try:
-        while True:
-            time.sleep(1)
+        # Block the main thread until Ctrl+C. The wait wakes hourly because an
+        # untimed lock wait cannot be interrupted by Ctrl+C on Windows
+        idle = threading.Event()
+        while not idle.wait(3600):
+            pass
     except KeyboardInterrupt:
         battery_monitor.stop_monitoring()
@@ -6,13 +6,59 @@ and perform a range of health checks including audio activity detection, signal-
 ratio analysis, clipping detection, frequency response analysis, and dynamic noise floor estimation.
 """
 
+import functools
 import pyaudio
 import numpy as np
+import scipy.fft
+import threading
 import time
 from assistant.core.speak_selector import speak
+from assistant.core.logger import get_logger
 
 from typing import List, Tuple, Optional, Dict
 
+logger = get_logger("MicHealth")
+
+# Audio stream configuration constants, shared by every health check
+CHUNK = 1024  # Audio chunk size (samples per buffer)
+FORMAT = pyaudio.paInt16  # 16-bit resolution
+CHANNELS = 1  # Mono audio
+RATE = 44100  # Sampling rate (Hz) - CD quality
+
+# Analysis constants
+FFT_BATCH = 32  # Chunks transformed per rfft call
+# Strictly positive frequency bins below Nyquist, the same set the former
+# fftfreq(...) > 0 mask selected; drops the DC offset bin
+POS_SLICE = slice(1, CHUNK // 2)
+SPECTRUM_BINS = POS_SLICE.stop - POS_SLICE.start
+# Hann window applied before each FFT to limit spectral leakage between bins
+WINDOW = np.hanning(CHUNK).astype(np.float32)
+
+
+def _enumerate_input_devices() -> List[Tuple[int, str]]:
+    """
+    Query PyAudio for every device with input channels.
+
+    Not cached: device indices shift when a microphone is plugged in or removed,
+    and the user picks a device by its index.
+
+    Returns:
+        list: (device_index, device_name) pairs for each input device
+    """
+    audio = pyaudio.PyAudio()
+    try:
+        info = audio.get_host_api_info_by_index(0)
+        numdevices = info.get("deviceCount")
+        devices = []
+        for i in range(0, numdevices):
+            device_info = audio.get_device_info_by_host_api_device_index(0, i)
+            if device_info.get("maxInputChannels") > 0:
+                devices.append((i, device_info.get("name")))
+    finally:
+        audio.terminate()
+    return devices
+
+
 def list_input_devices() -> List[Tuple[int, str]]:
     """
     List all available audio input devices on the system.
@@ -23,22 +69,56 @@ def list_input_devices() -> List[Tuple[int, str]]:
     Returns:
         list: A list of tuples containing (device_index, device_name) for each input device
     """
-    audio = pyaudio.PyAudio()
-    info = audio.get_host_api_info_by_index(0)
-    numdevices = info.get("deviceCount")
-    devices = []
+    devices = _enumerate_input_devices()
 
     speak("Available input devices:")
-    for i in range(0, numdevices):
-        device_info = audio.get_device_info_by_host_api_device_index(0, i)
-        if device_info.get("maxInputChannels") > 0:
-            devices.append((i, device_info.get("name")))
-            speak(f"{i}: {device_info.get('name')}")
+    for index, name in devices:
+        speak(f"{index}: {name}")
 
-    audio.terminate()
     return devices
 
 
+def _noise_floor_trace(rms_levels: np.ndarray, initial: float = 10.0) -> np.ndarray:
+    """
+    Track the ambient noise floor across chunks with an exponential moving average.
+
+    The floor only adapts to chunks that are not far above the current estimate,
+    so speech does not drag it upwards. Each step depends on the previous one,
+    which is why this is the single serial pass of the analysis.
+
+    Args:
+        rms_levels (np.ndarray): RMS level of each recorded chunk
+        initial (float): Starting noise floor estimate (default: 10.0)
+
+    Returns:
+        np.ndarray: Noise floor estimate after each chunk
+    """
+    trace = np.empty(len(rms_levels), dtype=np.float64)
+    noise_floor = initial
+    for i in range(len(rms_levels)):
+        rms = rms_levels[i]
+        if rms < noise_floor * 1.5:  # Only update if not too far from current estimate
+            noise_floor = 0.95 * noise_floor + 0.05 * rms
+        trace[i] = noise_floor
+    return trace
+
+
+@functools.lru_cache(maxsize=1)
+def _noise_floor_kernel():
+    """
+    Return ``_noise_floor_trace`` compiled with numba, or as plain Python without it.
+
+    numba is optional and slow to import, so it is only loaded on the first
+    analysis. cache=True keeps the compiled kernel on disk so later runs skip
+    the JIT cost.
+    """
+    try:
+        import numba
+    except ImportError:
+        return _noise_floor_trace
+    return numba.njit(cache=True)(_noise_floor_trace)
+
+
 def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_index: Optional[int] = None) -> Optional[Dict[str, float]]:
     """
     Perform comprehensive microphone health analysis.
@@ -64,12 +144,6 @@ def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_i
                       - Frequency Range Coverage (%): How well frequency spectrum is captured
                       - Noise Floor: Estimated background noise level
     """
-    # Audio stream configuration constants
-    CHUNK = 1024  # Audio chunk size (samples per buffer)
-    FORMAT = pyaudio.paInt16  # 16-bit resolution
-    CHANNELS = 1  # Mono audio
-    RATE = 44100  # Sampling rate (Hz) - CD quality
-
     # Initialize PyAudio
     audio = pyaudio.PyAudio()
 
@@ -83,6 +157,31 @@ def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_i
             speak("Error getting default input device, using first available")
             device_index = 0
 
+    total_chunks = int(RATE / CHUNK * seconds)  # Total chunks to process
+
+    # Flat recording buffer filled from PortAudio's callback thread, so acquisition
+    # never waits on analysis. Samples are appended at a cursor, which also copes
+    # with callbacks that deliver more or fewer than CHUNK frames.
+    total_samples = total_chunks * CHUNK
+    recording = np.empty(total_samples, dtype=np.int16)
+    recorded_samples = 0
+    overflows = 0
+    recording_done = threading.Event()
+
+    def on_audio(in_data, frame_count, time_info, status):
+        nonlocal recorded_samples, overflows
+        # Counted here and reported after recording, off PortAudio's thread
+        if status & pyaudio.paInputOverflow:
+            overflows += 1
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        take = min(len(samples), total_samples - recorded_samples)
+        recording[recorded_samples:recorded_samples + take] = samples[:take]
+        recorded_samples += take
+        if recorded_samples >= total_samples:
+            recording_done.set()
+            return (None, pyaudio.paComplete)
+        return (None, pyaudio.paContinue)
+
     try:
         # Open the audio stream with explicit device index
         stream = audio.open(
@@ -92,88 +191,83 @@ def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_i
             input=True,
             input_device_index=device_index,
             frames_per_buffer=CHUNK,
+            stream_callback=on_audio,
+            start=False,
         )
     except Exception as e:
-        print(f"Error opening stream: {e}")
+        logger.error("Error opening stream: %s", e)
         audio.terminate()
         return None
 
     speak(f"Recording for {seconds} seconds...")
     time.sleep(1)  # Small pause before recording to stabilize
 
-    # Initialize analysis variables
-    sound_count = 0  # Count of chunks with detected sound
-    total_chunks = int(RATE / CHUNK * seconds)  # Total chunks to process
-    noise_floor = 10.0  # Initial noise floor estimate
-    clipping_count = 0  # Count of clipped audio chunks
-    signal_sum = 0  # Sum of sound levels for SNR calculation
-    noise_sum = 0  # Sum of background noise levels
-    freq_analysis = []  # Frequency analysis data storage
-
-    # Process audio data in chunks
-    for i in range(0, total_chunks):
-        try:
-            # Read audio data from stream
-            data = np.frombuffer(
-                stream.read(CHUNK, exception_on_overflow=False), dtype=np.int16
-            )
-        except Exception as e:
-            print(f"Error reading audio: {e}")
-            continue
-
-        # Calculate volume using Root Mean Square (RMS)
-        if len(data) > 0:
-            rms = np.sqrt(np.mean(np.square(data.astype(np.float32))))
-        else:
-            rms = 0
-
-        # Frequency analysis using Fast Fourier Transform (FFT)
-        if len(data) > 0:
-            fft_data = np.fft.fft(data.astype(np.float32))
-            freqs = np.fft.fftfreq(len(fft_data), 1.0 / RATE)
-            positive_freq_idx = np.where(freqs > 0)  # Only positive frequencies
-            fft_spectrum = np.abs(fft_data[positive_freq_idx])
-            freq_analysis.append(fft_spectrum)
-        else:
-            fft_spectrum = np.array([0])
-            freq_analysis.append(fft_spectrum)
-
-        # Update ambient noise level using exponential moving average
-        if rms < noise_floor * 1.5:  # Only update if not too far from current estimate
-            noise_floor = 0.95 * noise_floor + 0.05 * rms
+    stream.start_stream()
+    finished = recording_done.wait(timeout=seconds + 2)
 
-        # Dynamic threshold based on ambient noise
-        dynamic_threshold = noise_floor * threshold_multiplier
-
-        # Check for sound detection above threshold
-        if rms > dynamic_threshold:  # Sound detected
-            sound_count += 1
-            signal_sum += rms
-        else:  # Background noise
-            noise_sum += rms
-
-        # Detect clipping (audio distortion when signal exceeds maximum range)
-        if (
-            len(data) > 0 and np.max(np.abs(data)) > 32700
-        ):  # 32700 is slightly below 16-bit max (32767)
-            clipping_count += 1
-
-    # Calculate final metrics
-    if total_chunks == 0:
-        print("No chunks processed")
-        stream.stop_stream()
-        stream.close()
-        audio.terminate()
+    # Clean up audio resources before analysis; the callback no longer runs after this
+    stream.stop_stream()
+    stream.close()
+    audio.terminate()
+
+    # Analysis reads the int16 recording directly; only one FFT batch at a time is
+    # ever converted to float32, into a buffer reused across batches
+    recorded = recorded_samples // CHUNK
+    if not finished:
+        logger.warning("Recording timed out after %d of %d chunks", recorded, total_chunks)
+    if overflows:
+        logger.warning("Input overflowed %d times; some audio was dropped", overflows)
+    frames = recording[:recorded * CHUNK].reshape(recorded, CHUNK)
+
+    # Volume of every chunk using Root Mean Square (RMS). Squares are summed as
+    # exact int64 integers straight from the int16 samples, with no float cast.
+    sum_squares = np.einsum("ij,ij->i", frames, frames, dtype=np.int64)
+    rms_levels = np.sqrt(sum_squares / CHUNK)
+
+    # Dynamic threshold based on the ambient noise level at each chunk
+    noise_floor_trace = _noise_floor_kernel()(rms_levels)
+    noise_floor = float(noise_floor_trace[-1]) if recorded > 0 else 10.0
+    sound_mask = rms_levels > noise_floor_trace * threshold_multiplier
+
+    # Frequency analysis using batched real FFTs, summed into a running spectrum so
+    # only one batch of spectra is alive at a time. Chunks at or below the noise
+    # floor are skipped, so coverage reflects active audio only.
+    active_rows = np.flatnonzero(rms_levels > noise_floor_trace)
+    active_count = len(active_rows)
+    spectrum_sum = np.zeros(SPECTRUM_BINS, dtype=np.float32)
+    fft_input = np.empty((FFT_BATCH, CHUNK), dtype=np.float32)
+    for start in range(0, active_count, FFT_BATCH):
+        rows = active_rows[start:start + FFT_BATCH]
+        block = fft_input[:len(rows)]
+        np.multiply(frames[rows], WINDOW, out=block)
+        batch = scipy.fft.rfft(block, axis=1, workers=-1)
+        spectrum_sum += np.abs(batch[:, POS_SLICE]).sum(axis=0)
+
+    # Sound detected above threshold vs background noise
+    sound_count = int(np.count_nonzero(sound_mask))
+    signal_sum = float(rms_levels[sound_mask].sum())
+    noise_sum = float(rms_levels[~sound_mask].sum())
+
+    # Detect clipping (audio distortion when signal exceeds maximum range)
+    # 32700 is slightly below 16-bit max (32767)
+    # Peaks are taken from both extremes rather than abs() so -32768 cannot wrap around
+    clipping_count = int(np.count_nonzero(
+        (frames.max(axis=1, initial=0) > 32700) | (frames.min(axis=1, initial=0) < -32700)
+    ))
+
+    # Calculate final metrics over the chunks actually recorded
+    if recorded == 0:
+        logger.warning("No chunks processed")
         return None
 
     # Microphone health percentage (activity detection rate)
-    mic_health = (sound_count / total_chunks) * 100
+    mic_health = (sound_count / recorded) * 100
 
     # Calculate average signal and noise with protection against division by zero
     avg_signal = signal_sum / sound_count if sound_count > 0 else 0
     avg_noise = (
-        noise_sum / (total_chunks - sound_count)
-        if (total_chunks - sound_count) > 0
+        noise_sum / (recorded - sound_count)
+        if (recorded - sound_count) > 0
         else noise_floor
     )
 
@@ -184,12 +278,12 @@ def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_i
         snr = 0  # Default value when SNR can't be calculated
 
     # Calculate clipping percentage
-    avg_clipping = (clipping_count / total_chunks) * 100
+    avg_clipping = (clipping_count / recorded) * 100
 
     # Frequency response analysis
-    if freq_analysis and len(freq_analysis) > 0:
+    if active_count > 0:
         try:
-            avg_fft_spectrum = np.mean(freq_analysis, axis=0)
+            avg_fft_spectrum = spectrum_sum / active_count
             # Calculate how much of the frequency spectrum has significant energy
             threshold = (
                 np.percentile(avg_fft_spectrum, 75) if len(avg_fft_spectrum) > 0 else 0
@@ -202,11 +296,6 @@ def get_mic_health(seconds: int = 5, threshold_multiplier: float = 3.0, device_i
     else:
         freq_range_coverage = 0
 
-    # Clean up audio resources
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
-
     # Compile comprehensive health report
     health_report = {
         "Microphone Health (%)": mic_health,
@@ -240,11 +329,11 @@ def mic_health() -> None:
         choice = int(input())
 
         # Validate choice
-        valid_choices = [device[0] for device in devices]
+        valid_choices = {device[0] for device in devices}
         if choice not in valid_choices:
             speak("Invalid choice. Using default device.")
             choice = None
-    except:
+    except (ValueError, EOFError):
         speak("Invalid input. Using default device.")
         choice = None
 
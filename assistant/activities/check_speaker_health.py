@@ -5,43 +5,179 @@ This module provides functions to generate and play test tones and frequency swe
 allowing for the assessment of speaker performance across the frequency spectrum.
 """
 
+import functools
 import numpy as np
-import pyaudio
 import time
-from scipy import signal
 from assistant.core.speak_selector import speak, wait_for_tts_completion
 
-from typing import Optional
+from typing import Callable, Optional, Tuple, TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import pyaudio
 
-def play_tone(frequency: float, duration: float = 2, volume: float = 0.5, sample_rate: int = 44100, p: Optional[pyaudio.PyAudio] = None) -> None:
+# Silence between test signals. stream.write already blocks until each tone has
+# been handed to the device, so this only keeps the tones audibly separate.
+TONE_GAP = 0.2
+
+# PyAudio module, imported on first playback so importing this module stays cheap
+_pyaudio = None
+
+# numba module, bound by _jit_kernels on the first render if it is installed
+numba = None
+
+
+def _get_pyaudio():
+    """Imports pyaudio on first use and returns the module."""
+    global _pyaudio
+    if _pyaudio is None:
+        import pyaudio
+        _pyaudio = pyaudio
+    return _pyaudio
+
+
+def _freeze(audio_data: np.ndarray) -> np.ndarray:
+    """Mark a cached array read-only so shared copies cannot be modified."""
+    audio_data.setflags(write=False)
+    return audio_data
+
+
+@functools.lru_cache(maxsize=8)
+def _time_axis(sample_rate: int, duration: float) -> np.ndarray:
     """
-    Generate and play a pure sine wave tone through the speaker system.
+    Sample times for a signal of ``duration`` seconds, shared by the NumPy render paths.
 
-    Creates a digital sine wave at the specified frequency and plays it through
-    the default audio output device. Uses 16-bit PCM format for compatibility.
+    The tones and the sweep mostly use the same few durations, so the axis is
+    built once per (sample_rate, duration) and returned read-only.
+    """
+    return _freeze(np.linspace(0, duration, int(sample_rate * duration), False))
 
-    Args:
-        frequency (float): Frequency of the tone in Hertz (Hz)
-        duration (float): Duration of the tone in seconds (default: 2)
-        volume (float): Amplitude scaling factor from 0.0 to 1.0 (default: 0.5)
-        sample_rate (int): Audio sampling rate in Hz (default: 44100 - CD quality)
-        p (pyaudio.PyAudio, optional): Existing PyAudio instance for resource reuse
 
-    Note:
-        If no PyAudio instance is provided, one will be created and terminated
-        internally. For multiple consecutive tones, it's more efficient to
-        provide an existing instance.
+@functools.lru_cache(maxsize=1)
+def _jit_kernels() -> Optional[Tuple[Callable, Callable]]:
     """
-    # Generate time samples for the sine wave
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    Import numba and define the render kernels on the first render.
 
-    # Generate sine wave: sin(2π * frequency * time)
-    tone = np.sin(frequency * t * 2 * np.pi)
+    numba is an optional extra and slower to import than everything else here,
+    so it is only loaded once a tone is actually rendered.
 
-    # Apply volume scaling and convert to 16-bit PCM format
+    Returns:
+        tuple or None: (fill_tone, fill_log_chirp), or None without numba
+    """
+    # Bound at module level so the kernels see numba as a global, not a
+    # closure variable, which keeps them cacheable on disk
+    global numba
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, fastmath=True)
+    def _fill_tone(out, cos_w, sin_w, amplitude):
+        """
+        Write ``amplitude * sin(w * n)`` into ``out`` using the oscillator recurrence.
+
+        y[n] = 2cos(w)·y[n-1] − y[n-2] needs one multiply-add per sample instead
+        of a sine call, and writes straight into the int16 buffer.
+        """
+        y1 = 0.0
+        y2 = -amplitude * sin_w  # y[-1] = amplitude * sin(-w)
+        for i in range(out.shape[0]):
+            out[i] = y1
+            y = 2.0 * cos_w * y1 - y2
+            y2 = y1
+            y1 = y
+
+    @numba.njit(cache=True, fastmath=True, parallel=True)
+    def _fill_log_chirp(out, start_freq, end_freq, duration, sample_rate, amplitude):
+        """
+        Write a logarithmic chirp into ``out``, matching ``scipy.signal.chirp(method="logarithmic")``.
+
+        Phase is 2π·f0·(k^t − 1)/ln(k) with k = (f1/f0)^(1/duration). Every sample
+        is independent, so the loop runs in parallel.
+        """
+        log_k = np.log(end_freq / start_freq) / duration
+        phase_scale = 2.0 * np.pi * start_freq / log_k
+        for i in numba.prange(out.shape[0]):
+            t = i / sample_rate
+            out[i] = amplitude * np.cos(phase_scale * (np.exp(log_k * t) - 1.0))
+
+    return _fill_tone, _fill_log_chirp
+
+
+@functools.lru_cache(maxsize=32)
+def _tone_pcm(frequency: float, duration: float, volume: float, sample_rate: int) -> bytes:
+    """
+    Render a sine tone as 16-bit PCM bytes.
+
+    Cached, since the health test plays the same few tones every run; repeat
+    plays only hand the stored bytes to PortAudio.
+    """
+    n_samples = int(sample_rate * duration)
     # 32767 is the maximum value for signed 16-bit integers
-    audio_data = (tone * volume * 32767).astype(np.int16)
+    amplitude = volume * 32767
+
+    kernels = _jit_kernels()
+    if kernels is not None:
+        fill_tone, _ = kernels
+        w = 2 * np.pi * frequency / sample_rate
+        audio_data = np.empty(n_samples, dtype=np.int16)
+        fill_tone(audio_data, np.cos(w), np.sin(w), amplitude)
+        return audio_data.tobytes()
+
+    # Time samples for the sine wave
+    t = _time_axis(sample_rate, duration)
+
+    # Generate sine wave: sin(2π * frequency * time), scaled to volume in place
+    # so the only float64 array is this one
+    tone = np.multiply(t, 2 * np.pi * frequency)
+    np.sin(tone, out=tone)
+    np.multiply(tone, amplitude, out=tone)
+
+    # Convert to 16-bit PCM format
+    return tone.astype(np.int16).tobytes()
+
+
+@functools.lru_cache(maxsize=8)
+def _sweep_pcm(duration: float, volume: float, sample_rate: int, start_freq: float, end_freq: float) -> bytes:
+    """Render a logarithmic frequency sweep as 16-bit PCM bytes, cached like ``_tone_pcm``."""
+    n_samples = int(sample_rate * duration)
+
+    kernels = _jit_kernels()
+    if kernels is not None:
+        _, fill_log_chirp = kernels
+        audio_data = np.empty(n_samples, dtype=np.int16)
+        fill_log_chirp(audio_data, start_freq, end_freq, duration, sample_rate, volume * 32767)
+        return audio_data.tobytes()
+
+    # scipy is only needed for this fallback, so it is imported here rather than
+    # on every import of the module
+    from scipy import signal
+
+    # Time samples for the sweep
+    t = _time_axis(sample_rate, duration)
+
+    # Generate logarithmic chirp (frequency sweep)
+    sweep = signal.chirp(
+        t, f0=start_freq, t1=duration, f1=end_freq, method="logarithmic"
+    )
+
+    # Scale to volume in place and convert to 16-bit PCM audio data
+    np.multiply(sweep, volume * 32767, out=sweep)
+    return sweep.astype(np.int16).tobytes()
+
+
+def _play_pcm(pcm: bytes, sample_rate: int, p: Optional["pyaudio.PyAudio"], stream: Optional["pyaudio.Stream"]) -> None:
+    """
+    Write 16-bit mono PCM to ``stream``, or to a temporary output stream if none is given.
+
+    A temporary stream is opened on ``p`` (or on a PyAudio instance created and
+    terminated here) and closed again once the audio has been written.
+    """
+    if stream is not None:
+        stream.write(pcm)
+        return
+
+    pyaudio = _get_pyaudio()
 
     # Initialize PyAudio if not provided
     if p is None:
@@ -55,8 +191,7 @@ def play_tone(frequency: float, duration: float = 2, volume: float = 0.5, sample
         stream = p.open(
             format=pyaudio.paInt16, channels=1, rate=sample_rate, output=True
         )
-        # Play the generated tone data
-        stream.write(audio_data.tobytes())
+        stream.write(pcm)
         stream.stop_stream()
         stream.close()
     finally:
@@ -65,8 +200,33 @@ def play_tone(frequency: float, duration: float = 2, volume: float = 0.5, sample
             p.terminate()
 
 
+def play_tone(frequency: float, duration: float = 2, volume: float = 0.5, sample_rate: int = 44100, p: Optional["pyaudio.PyAudio"] = None, stream: Optional["pyaudio.Stream"] = None) -> None:
+    """
+    Generate and play a pure sine wave tone through the speaker system.
+
+    Creates a digital sine wave at the specified frequency and plays it through
+    the default audio output device. Uses 16-bit PCM format for compatibility.
+
+    Args:
+        frequency (float): Frequency of the tone in Hertz (Hz)
+        duration (float): Duration of the tone in seconds (default: 2)
+        volume (float): Amplitude scaling factor from 0.0 to 1.0 (default: 0.5)
+        sample_rate (int): Audio sampling rate in Hz (default: 44100 - CD quality)
+        p (pyaudio.PyAudio, optional): Existing PyAudio instance for resource reuse
+        stream (pyaudio.Stream, optional): Open 16-bit mono output stream at
+            ``sample_rate`` to play on; it is left open for the caller
+
+    Note:
+        If no PyAudio instance is provided, one will be created and terminated
+        internally. For multiple consecutive tones, it's more efficient to
+        provide an existing instance.
+    """
+    _play_pcm(_tone_pcm(frequency, duration, volume, sample_rate), sample_rate, p, stream)
+
+
 def play_sweep(
-    duration: float = 5, volume: float = 0.5, sample_rate: int = 44100, start_freq: float = 20, end_freq: float = 20000, p: Optional[pyaudio.PyAudio] = None
+    duration: float = 5, volume: float = 0.5, sample_rate: int = 44100, start_freq: float = 20, end_freq: float = 20000, p: Optional["pyaudio.PyAudio"] = None,
+    stream: Optional["pyaudio.Stream"] = None,
 ) -> None:
     """
     Generate and play a logarithmic frequency sweep through the speaker system.
@@ -81,41 +241,14 @@ def play_sweep(
         start_freq (float): Starting frequency of sweep in Hz (default: 20 - near human hearing limit)
         end_freq (float): Ending frequency of sweep in Hz (default: 20000 - upper human hearing limit)
         p (pyaudio.PyAudio, optional): Existing PyAudio instance for resource reuse
+        stream (pyaudio.Stream, optional): Open 16-bit mono output stream at
+            ``sample_rate`` to play on; it is left open for the caller
 
     Note:
         Logarithmic sweeps provide equal time per octave, making them ideal for
         testing speaker frequency response across the human hearing range.
     """
-    # Generate time samples for the sweep
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-
-    # Generate logarithmic chirp (frequency sweep)
-    sweep = signal.chirp(
-        t, f0=start_freq, t1=duration, f1=end_freq, method="logarithmic"
-    )
-
-    # Convert to 16-bit PCM audio data
-    audio_data = (sweep * volume * 32767).astype(np.int16)
-
-    # Initialize PyAudio if not provided
-    if p is None:
-        p = pyaudio.PyAudio()
-        close_p = True
-    else:
-        close_p = False
-
-    try:
-        # Open audio output stream and play the sweep
-        stream = p.open(
-            format=pyaudio.paInt16, channels=1, rate=sample_rate, output=True
-        )
-        stream.write(audio_data.tobytes())
-        stream.stop_stream()
-        stream.close()
-    finally:
-        # Terminate PyAudio only if we created it internally
-        if close_p:
-            p.terminate()
+    _play_pcm(_sweep_pcm(duration, volume, sample_rate, start_freq, end_freq), sample_rate, p, stream)
 
 
 def speaker_health_test() -> None:
@@ -143,44 +276,52 @@ def speaker_health_test() -> None:
     speak("Playing test tones...")
     wait_for_tts_completion()
     health_score = 0
+    pyaudio = _get_pyaudio()
     p = pyaudio.PyAudio()  # Initialize PyAudio once for efficiency
+    stream = None
 
     try:
+        # One output stream shared by every tone and the sweep
+        stream = p.open(format=pyaudio.paInt16, channels=1, rate=44100, output=True)
+
         # Test low-frequency response (bass capabilities)
         speak("Playing 100 Hz tone...")
         wait_for_tts_completion()
-        play_tone(100, duration=2, p=p)
-        time.sleep(1)  # Brief pause between tones
+        play_tone(100, duration=2, stream=stream)
+        time.sleep(TONE_GAP)  # Brief pause between tones
         health_score += 25  # Low frequency test passed
 
         # Test mid-frequency response (vocal range)
         speak("Playing 1000 Hz tone...")
         wait_for_tts_completion()
-        play_tone(1000, duration=2, p=p)
-        time.sleep(1)
+        play_tone(1000, duration=2, stream=stream)
+        time.sleep(TONE_GAP)
         health_score += 25  # Mid frequency test passed
 
         # Test high-frequency response (treble capabilities)
         speak("Playing 5000 Hz tone...")
         wait_for_tts_completion()
-        play_tone(5000, duration=2, p=p)
-        time.sleep(1)
+        play_tone(5000, duration=2, stream=stream)
+        time.sleep(TONE_GAP)
         health_score += 20  # High frequency test passed
 
         speak("Playing 10,000 Hz tone...")
         wait_for_tts_completion()
-        play_tone(10000, duration=2, p=p)
-        time.sleep(1)
+        play_tone(10000, duration=2, stream=stream)
+        time.sleep(TONE_GAP)
         health_score += 15  # Very high frequency test passed
 
         # Test full frequency range with logarithmic sweep
         speak("Playing frequency sweep from 20 Hz to 20,000 Hz...")
         wait_for_tts_completion()
-        play_sweep(duration=5, p=p)
-        time.sleep(1)
+        play_sweep(duration=5, stream=stream)
+        time.sleep(TONE_GAP)
         health_score += 15  # Frequency sweep test passed
 
     finally:
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
         p.terminate()  # Ensure PyAudio is properly terminated
 
     # Speaker health assessment and reporting
@@ -1,12 +1,17 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated connectivity checks reuse one keep-alive connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 
 def is_online(url: str = "https://www.google.com", timeout: int = 5) -> bool:
     """
     Check internet connectivity by attempting to reach a specified URL.
 
-    This function tests network connectivity by making an HTTP GET request
-    to a target website. It's commonly used to verify if the system has
+    This function tests network connectivity by making an HTTP HEAD request
+    to a target website, so only response headers are transferred. It's commonly used to verify if the system has
     active internet access before attempting network-dependent operations.
 
     Args:
@@ -16,8 +21,9 @@ def is_online(url: str = "https://www.google.com", timeout: int = 5) -> bool:
                       Prevents hanging on slow or unresponsive connections.
 
     Returns:
-        bool: True if the request succeeds with HTTP status code 200-299,
-              False if connection fails or times out.
+        bool: True if the server answers with HTTP status code 200-399
+              (redirects are not followed, but they prove connectivity),
+              False if the request fails or times out.
 
     Examples:
         >>> is_online()
@@ -28,12 +34,11 @@ def is_online(url: str = "https://www.google.com", timeout: int = 5) -> bool:
         False  # If connection times out in 2 seconds
 
     Note:
-        The function specifically catches ConnectionError exceptions but
-        allows other exceptions to propagate, as they may indicate more
-        serious issues that should be handled by the caller.
+        Any ``requests.RequestException`` (connection errors, timeouts, SSL
+        failures) is treated as being offline.
     """
     try:
-        response = requests.get(url, timeout=timeout)
-        return response.status_code >= 200 and response.status_code < 300
-    except requests.ConnectionError:
+        response = _SESSION.head(url, timeout=timeout, allow_redirects=False)
+        return 200 <= response.status_code < 400
+    except requests.RequestException:
         return False
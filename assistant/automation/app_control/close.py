@@ -4,6 +4,10 @@ Module for handling application closure commands via voice or system shortcuts.
 import pyautogui as ui
 import random
 import psutil
+try:
+    import keyboard
+except ImportError:
+    keyboard = None
 from assistant.core.speak_selector import notify
 from data.dlg_data.dlg import closedlg
 from typing import Optional
@@ -33,7 +37,12 @@ def close_command(app_name: Optional[str] = None) -> None:
             notify(f"I couldn't find {app_name} running.")
     else:
         notify(random.choice(closedlg))
-        ui.hotkey("alt", "f4")
+        # keyboard sends the whole chord in one SendInput call; pyautogui presses
+        # and releases each key separately with its own pauses
+        if keyboard is not None:
+            keyboard.send("alt+f4")
+        else:
+            ui.hotkey("alt", "f4")
 
 @on_regex(r"\b(?:close|exit|terminate|kill)\s+(?P<app_name>.+)$")
 @on_fuzzy(["close", "exit", "close that", "close app"], score_cutoff=90)
@@ -4,11 +4,19 @@ via voice commands, utilizing system automation and fuzzy matching for user inte
 """
 
 import os
+import sys
+import ctypes
 import pyautogui as ui
+try:
+    import keyboard
+except ImportError:
+    keyboard = None
 import webbrowser
 import time
 import random
-import difflib
+import functools
+from typing import Optional
+from rapidfuzz import process, fuzz
 from assistant.core.speak_selector import notify
 from data.dlg_data.dlg import open_dlg, open_website_maybe, sorry_web, websites
 
@@ -29,6 +37,56 @@ common_apps = {
     "firefox": "firefox"
 }
 
+# Start menu window class on Windows 10/11, and the longest wait for it to take
+# focus; this is the fixed delay appOpen used before polling
+_START_MENU_CLASS = "Windows.UI.Core.CoreWindow"
+_START_MENU_TIMEOUT = 0.7
+# Pause after typing so Windows search can surface its top result
+_SEARCH_SETTLE_DELAY = 0.5
+
+
+def _wait_for_start_menu(timeout: float = _START_MENU_TIMEOUT) -> None:
+    """
+    Blocks until the Start menu is the foreground window, or ``timeout`` expires.
+
+    Polls every 20 ms instead of sleeping a fixed time, so typing starts as soon
+    as the menu is ready. Off Windows, or if the menu is never detected, this
+    waits out ``timeout`` like the old fixed delay.
+    """
+    if sys.platform != "win32":
+        time.sleep(timeout)
+        return
+
+    user32 = ctypes.windll.user32
+    class_name = ctypes.create_unicode_buffer(64)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        hwnd = user32.GetForegroundWindow()
+        if hwnd and user32.GetClassNameW(hwnd, class_name, len(class_name)):
+            if class_name.value == _START_MENU_CLASS:
+                return
+        time.sleep(0.02)
+
+
+# Website names, frozen once for fuzzy matching
+_SITE_KEYS = tuple(websites.keys())
+
+
+@functools.lru_cache(maxsize=256)
+def _closest_site(text: str) -> Optional[str]:
+    """
+    Returns the website name closest to ``text``, or None if nothing is close enough.
+
+    Cached, since the same spoken names come up again and again and open_command
+    and webOpen both look up the same text.
+    """
+    # fuzz.ratio is the same similarity difflib's get_close_matches used, so the
+    # 60 cutoff keeps the old 0.6 behaviour while the scan runs in C++. Every name
+    # is scored: prefiltering can drop the best match, and the full scan is
+    # already only microseconds
+    match = process.extractOne(text, _SITE_KEYS, scorer=fuzz.ratio, score_cutoff=60)
+    return match[0] if match else None
+
 
 def appOpen(text: str) -> bool:
     """
@@ -48,11 +106,18 @@ def appOpen(text: str) -> bool:
             os.system(f"start {common_apps[clean_name]}")
             return True
             
-        ui.press("win")
-        time.sleep(0.7)
-        ui.write(text, interval=0.05)
-        time.sleep(0.5)
-        ui.press("enter")
+        if keyboard is not None:
+            keyboard.send("win")
+            _wait_for_start_menu()
+            keyboard.write(text, delay=0.05)
+            time.sleep(_SEARCH_SETTLE_DELAY)
+            keyboard.send("enter")
+        else:
+            ui.press("win")
+            _wait_for_start_menu()
+            ui.write(text, interval=0.05)
+            time.sleep(_SEARCH_SETTLE_DELAY)
+            ui.press("enter")
         return True
     except Exception as e:
         notify(f"Failed to open application {text}. Error: {str(e)}")
@@ -76,9 +141,8 @@ def webOpen(text: str) -> bool:
         webbrowser.open(websites[text])
         return True
 
-    matches = difflib.get_close_matches(text, websites.keys(), n=1, cutoff=0.6)
-    if matches:
-        closest_match = matches[0]
+    closest_match = _closest_site(text)
+    if closest_match:
         notify(f"{random.choice(open_website_maybe)} {closest_match}")
         webbrowser.open(websites[closest_match])
         return True
@@ -100,9 +164,7 @@ def open_command(text: str) -> None:
         notify("Please specify what you want to open.")
         return
 
-    is_known_website = clean_text in websites or difflib.get_close_matches(
-        clean_text, websites.keys(), n=1, cutoff=0.6
-    )
+    is_known_website = clean_text in websites or _closest_site(clean_text) is not None
 
     if is_known_website:
         webOpen(text)
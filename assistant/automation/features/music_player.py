@@ -22,16 +22,46 @@ Dependencies:
 
 import os
 import random
+import threading
 import pygame
 from assistant.core.speak_selector import speak, notify
 from assistant.core.config import config
+from assistant.core.logger import get_logger
+
+logger = get_logger("MusicPlayer")
 
 
 # Initialize pygame mixer for audio playback
 pygame.mixer.init()
 
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
+
+# Supported audio file extensions, lowercase and without the dot
+SUPPORTED_FORMATS = frozenset(("mp3", "wav", "m4a", "flac", "aac"))
+
+
+def _scan_music_dir(directory: str) -> Iterator[str]:
+    """
+    List the supported audio files directly inside a music directory with os.scandir.
+
+    Directory entries carry their type from the directory listing itself, so no
+    extra stat call is made per file. Subfolders are not scanned.
+
+    Args:
+        directory (str): Directory to scan
+
+    Yields:
+        str: File name of each supported audio file
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            # Check the extension before asking for the entry type
+            dot = name.rfind(".")
+            if dot >= 0 and name[dot + 1:].lower() in SUPPORTED_FORMATS and entry.is_file():
+                yield name
+
 
 class MusicPlayer:
     """
@@ -62,8 +92,74 @@ class MusicPlayer:
         self.is_playing = False
         self.is_paused = False
         self.playlist = []
-        self.current_index = 0
+        self.current_index = -1  # Nothing played yet; the first advance lands on 0
         self.volume = 0.7  # Default volume (0.0 to 1.0)
+        self._music_files_cache: Optional[List[str]] = None
+        self._dir_mtime: Optional[int] = None
+        self._scan_lock = threading.Lock()
+        self._playlist_source: Optional[List[str]] = None  # File list the playlist was built from
+
+        # Scan the library in the background so the first "play music" command
+        # does not wait on the directory walk
+        threading.Thread(target=self._prefetch, daemon=True).start()
+
+    def _prefetch(self) -> None:
+        """Warm the file list cache and prepare a shuffled playlist ahead of the first command."""
+        # Stay silent here; a missing folder is reported when music is requested
+        if not os.path.isdir(self.music_dir):
+            return
+        self._sync_playlist(self.get_music_files())
+
+    def _sync_playlist(self, music_files: List[str]) -> None:
+        """
+        Build the shuffled playlist, or reconcile it with a rescanned file list.
+
+        get_music_files returns the same list object until the directory changes,
+        so an identity check makes this a no-op between rescans. After a rescan,
+        deleted tracks are dropped and new ones are shuffled into the part of the
+        playlist not yet played, keeping the current position.
+
+        Args:
+            music_files (list): Current result of get_music_files
+        """
+        if music_files is self._playlist_source:
+            return
+
+        if not self.playlist:
+            playlist = music_files.copy()
+            random.shuffle(playlist)
+            self.current_index = -1
+        else:
+            available = set(music_files)
+            known = set(self.playlist)
+            played = [t for t in self.playlist[:self.current_index + 1] if t in available]
+            upcoming = [t for t in self.playlist[self.current_index + 1:] if t in available]
+            upcoming.extend(t for t in music_files if t not in known)
+            random.shuffle(upcoming)
+            playlist = played + upcoming
+            self.current_index = len(played) - 1
+
+        self.playlist = playlist
+        self._playlist_source = music_files
+
+    def invalidate_cache(self) -> None:
+        """Force the next get_music_files call to rescan the music directory."""
+        self._music_files_cache = None
+        self._dir_mtime = None
+
+    def _cache_is_fresh(self) -> bool:
+        """
+        Check whether the cached file list still matches the music directory.
+
+        Adding, removing or renaming a file updates the modification time of the
+        music directory, so a single stat detects any change.
+        """
+        if self._music_files_cache is None:
+            return False
+        try:
+            return os.stat(self.music_dir).st_mtime_ns == self._dir_mtime
+        except OSError:
+            return False
 
     def get_music_files(self) -> List[str]:
         """
@@ -71,26 +167,33 @@ class MusicPlayer:
 
         Supported formats include: MP3, WAV, M4A, FLAC, AAC
 
+        The result is cached and reused until the directory's modification time
+        changes or invalidate_cache() is called.
+
         Returns:
             list: List of supported music filenames found in the directory
 
         Raises:
             Prints error message if directory doesn't exist
         """
-        supported_formats = (".mp3", ".wav", ".m4a", ".flac", ".aac")
-        music_files = []
-
         # Check if music directory exists
         if not os.path.exists(self.music_dir):
             notify("Music directory not found. Please check the path.")
             return []
 
-        # Scan directory for supported audio files
-        for file in os.listdir(self.music_dir):
-            if file.lower().endswith(supported_formats):
-                music_files.append(file)
+        # A command arriving mid-prefetch waits for that scan instead of starting another
+        with self._scan_lock:
+            if self._cache_is_fresh():
+                return self._music_files_cache
+
+            # Stamp before listing, so a file added mid-scan triggers a rescan next time
+            dir_mtime = os.stat(self.music_dir).st_mtime_ns
+            # Scan directory for supported audio files
+            music_files = list(_scan_music_dir(self.music_dir))
 
-        return music_files
+            self._music_files_cache = music_files
+            self._dir_mtime = dir_mtime
+            return music_files
 
     def play_random_music(self) -> None:
         """
@@ -98,9 +201,10 @@ class MusicPlayer:
 
         This method:
         1. Scans for available music files
-        2. Creates a shuffled playlist if none exists
+        2. Creates a shuffled playlist, or updates it if the folder changed
         3. Stops any currently playing music
-        4. Plays a random track from available music
+        4. Plays the next track of the shuffled playlist, so repeated requests
+           work through the whole library before any song repeats
         5. Provides voice feedback on playback
 
         Voice Commands that use this:
@@ -115,17 +219,16 @@ class MusicPlayer:
             notify("No music files found in your Music directory.")
             return
 
-        # Create shuffled playlist if empty
-        if not self.playlist:
-            self.playlist = music_files.copy()
-            random.shuffle(self.playlist)
+        # Create the shuffled playlist, or pick up songs added or removed since
+        self._sync_playlist(music_files)
 
         # Stop currently playing music before starting new track
         if self.is_playing:
             self.stop_music()
 
-        # Select and play random track
-        self.current_track = random.choice(self.playlist)
+        # Advance through the shuffled playlist; the order is already random
+        self.current_index = (self.current_index + 1) % len(self.playlist)
+        self.current_track = self.playlist[self.current_index]
         track_path = os.path.join(self.music_dir, self.current_track)
 
         try:
@@ -141,7 +244,7 @@ class MusicPlayer:
 
         except Exception as e:
             notify("Sorry, I couldn't play the music file.")
-            print(f"Music playback error: {e}")
+            logger.error("Music playback error: %s", e)
 
     def play_specific_song(self, song_name: str) -> None:
         """
@@ -190,7 +293,7 @@ class MusicPlayer:
 
         except Exception as e:
             notify("Sorry, I couldn't play the music file.")
-            print(f"Music playback error: {e}")
+            logger.error("Music playback error: %s", e)
 
     def pause_music(self) -> None:
         """
@@ -264,6 +367,8 @@ class MusicPlayer:
         - "next song"
         - "play next"
         """
+        if self.playlist:
+            self._sync_playlist(self.get_music_files())
         if not self.playlist:
             notify("No playlist available")
             return
@@ -285,7 +390,7 @@ class MusicPlayer:
 
         except Exception as e:
             notify("Sorry, I couldn't play the next track.")
-            print(f"Music playback error: {e}")
+            logger.error("Music playback error: %s", e)
 
     def previous_track(self) -> None:
         """
@@ -300,6 +405,8 @@ class MusicPlayer:
         - "play previous"
         - "last song"
         """
+        if self.playlist:
+            self._sync_playlist(self.get_music_files())
         if not self.playlist:
             notify("No playlist available")
             return
@@ -321,7 +428,7 @@ class MusicPlayer:
 
         except Exception as e:
             notify("Sorry, I couldn't play the previous track.")
-            print(f"Music playback error: {e}")
+            logger.error("Music playback error: %s", e)
 
     def set_volume(self, level: float) -> None:
         """
@@ -349,7 +456,7 @@ class MusicPlayer:
 
         except Exception as e:
             notify("Sorry, I couldn't adjust the volume")
-            print(f"Volume adjustment error: {e}")
+            logger.error("Volume adjustment error: %s", e)
 
     def increase_volume(self) -> None:
         """
@@ -3,15 +3,23 @@ Module for managing persistent Question & Answer data using JSON storage.
 Provides thread-safe loading and atomic saving mechanisms for data integrity.
 """
 
-import json
+import atexit
+import orjson
 import os
 from pathlib import Path
 import tempfile
 import threading
-from typing import Dict, Union
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from assistant.core.json_utils import read_json_file
 
 qa_lock = threading.Lock()
 
+# Seconds to wait after the last change before writing the Q&A file, so a burst
+# of new answers is saved once
+SAVE_DELAY = 2.0
+
 def load_qa_data(file_path: Union[str, Path]) -> Dict[str, str]:
     """
     Loads Q&A data from a JSON file, supporting legacy list formats and modern dictionaries.
@@ -27,17 +35,18 @@ def load_qa_data(file_path: Union[str, Path]) -> Dict[str, str]:
 
     try:
         if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    for item in data:
-                        if ":" in item:
-                            q, a = item.split(":", 1)
-                            qa_dict[q.strip()] = a.strip()
-                else:
-                    qa_dict = data
+            data = read_json_file(file_path)
+            if isinstance(data, list):
+                # Legacy format: "question: answer" strings; entries without a colon are skipped
+                qa_dict = {
+                    q.strip(): a.strip()
+                    for q, sep, a in (item.partition(":") for item in data)
+                    if sep
+                }
+            else:
+                qa_dict = data
         print(f"Loaded {len(qa_dict)} Q&A pairs from {file_path}")
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
         print(f"Could not load QA data: {e}, starting with default dataset")
         qa_dict = {"who are you?": "I am Jarvis, an AI assistant created to help you."}
         try:
@@ -50,13 +59,16 @@ def load_qa_data(file_path: Union[str, Path]) -> Dict[str, str]:
     return qa_dict
 
 
-def save_qa_data(file_path: Union[str, Path], qa_dict: Dict[str, str]) -> None:
+def save_qa_data(file_path: Union[str, Path], qa_dict: Dict[str, str]) -> bool:
     """
     Saves Q&A data to a JSON file using an atomic write operation to prevent corruption.
 
     Args:
         file_path: Destination path for the JSON file.
         qa_dict: Dictionary of Q&A pairs to persist.
+
+    Returns:
+        True if the file was written, False if saving failed.
     """
     tmp_path = None
     try:
@@ -64,29 +76,221 @@ def save_qa_data(file_path: Union[str, Path], qa_dict: Dict[str, str]) -> None:
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         with tempfile.NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             dir=str(file_path.parent),
             delete=False,
             suffix=".tmp",
         ) as tmp_file:
-            json.dump(qa_dict, tmp_file, indent=2, ensure_ascii=False)
             tmp_path = tmp_file.name
+            # orjson writes UTF-8 bytes directly, matching the old ensure_ascii=False output
+            tmp_file.write(orjson.dumps(qa_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            # Make sure the data is on disk before the rename publishes it
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
 
-        if os.path.exists(file_path):
-            os.replace(tmp_path, str(file_path))
-        else:
-            os.rename(tmp_path, str(file_path))
+        # os.replace overwrites atomically whether or not the target exists
+        os.replace(tmp_path, str(file_path))
+        if os.name != "nt":
+            # The rename lives in the directory entry; sync it so it survives a power cut
+            dir_fd = os.open(str(file_path.parent), os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        return True
     except Exception as e:
         print(f"Error saving QA data: {e}")
         if tmp_path and os.path.exists(tmp_path):
             try:
                 os.unlink(tmp_path)
-            except:
+            except OSError:
                 pass
+        return False
+
+
+def journal_paths(file_path: Union[str, Path]) -> Tuple[Path, Path]:
+    """
+    Returns the append-only journal next to a Q&A file and the name it is rotated to.
+
+    ``qna_data.json`` is journaled to ``qna_data.jsonl``. During compaction the
+    journal is renamed to ``qna_data.jsonl.old`` so new entries can keep going
+    to a fresh journal while the full file is rewritten.
+    """
+    journal = Path(file_path).with_suffix(".jsonl")
+    return journal, journal.with_name(journal.name + ".old")
+
+
+def append_qa_journal(journal_path: Path, question: str, answer: str) -> None:
+    """
+    Durably appends one Q&A pair to the journal as a JSON line.
+
+    Only the new entry is written, however large the Q&A file has grown.
+    """
+    line = orjson.dumps({"q": question, "a": answer}) + b"\n"
+    with open(journal_path, "a+b") as f:
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                # End a line torn by a crash, so it cannot swallow this entry
+                line = b"\n" + line
+        f.write(line)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def replay_qa_journal(journal_path: Path, qa_dict: Dict[str, str]) -> int:
+    """
+    Applies journaled Q&A pairs to ``qa_dict`` in the order they were written.
+
+    A torn final line, left by a crash mid-append, is ignored.
+
+    Returns:
+        The number of entries applied.
+    """
+    applied = 0
+    try:
+        with open(journal_path, "rb") as f:
+            for line in f:
+                try:
+                    entry = orjson.loads(line)
+                    qa_dict[entry["q"]] = entry["a"]
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    continue
+                applied += 1
+    except FileNotFoundError:
+        pass
+    return applied
 
 from assistant.core.config import config
 
 qa_file_path = str(config.qna_data_path)
 
-qa_dict = load_qa_data(qa_file_path)
+class QAStore:
+    """
+    Holds the shared Q&A dictionary and persists it through a journal.
+
+    The dictionary is loaded on first use, so importing this module does no
+    file I/O. It is never modified in place: ``put`` builds a new dictionary
+    under ``qa_lock`` and rebinds it, so ``get`` and ``snapshot`` need no lock
+    and always see a complete mapping.
+
+    Each ``put`` appends just the new pair to an append-only journal, so it is
+    durable immediately at the cost of one small write. A single background
+    writer compacts the journal into the JSON file once ``SAVE_DELAY`` seconds
+    pass without further updates, so a burst of updates rewrites the file once.
+    Any pending compaction is run at interpreter exit.
+    """
+
+    def __init__(self, file_path: Union[str, Path], delay: float = SAVE_DELAY) -> None:
+        self.file_path = file_path
+        self.journal_path, self.rotated_journal_path = journal_paths(file_path)
+        self.delay = delay
+        self._data: Optional[Dict[str, str]] = None
+        self._load_lock = threading.Lock()
+        self._changed = threading.Condition()
+        self._dirty = False
+        self._deadline = 0.0
+        self._writer: Optional[threading.Thread] = None
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def snapshot(self) -> Dict[str, str]:
+        """
+        Returns the current Q&A mapping, loading it from disk on first use.
+
+        The returned dictionary must be treated as read-only.
+        """
+        data = self._data
+        if data is None:
+            with self._load_lock:
+                if self._data is None:
+                    loaded = load_qa_data(self.file_path)
+                    # Entries journaled but not yet compacted, oldest journal first
+                    replayed = replay_qa_journal(self.rotated_journal_path, loaded)
+                    replayed += replay_qa_journal(self.journal_path, loaded)
+                    self._data = loaded
+                    if replayed:
+                        self.mark_dirty()
+                data = self._data
+        return data
+
+    def get(self, question: str) -> Optional[str]:
+        """Returns the stored answer for ``question``, or None."""
+        return self.snapshot().get(question)
+
+    def put(self, question: str, answer: str) -> None:
+        """Stores an answer, journals it and schedules a compaction."""
+        with qa_lock:
+            updated = dict(self.snapshot())
+            updated[question] = answer
+            self._data = updated
+            try:
+                append_qa_journal(self.journal_path, question, answer)
+            except OSError as e:
+                print(f"Error journaling QA data: {e}")
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Schedules a save, postponing any save that is already pending."""
+        with self._changed:
+            self._dirty = True
+            self._deadline = time.monotonic() + self.delay
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, daemon=True)
+                self._writer.start()
+            self._changed.notify()
+
+    def _write_loop(self) -> None:
+        """Background writer: waits for changes, lets them settle, then saves once."""
+        while True:
+            with self._changed:
+                while not self._dirty:
+                    self._changed.wait()
+                # Each new change pushes the deadline back, coalescing bursts
+                remaining = self._deadline - time.monotonic()
+                while remaining > 0:
+                    self._changed.wait(remaining)
+                    remaining = self._deadline - time.monotonic()
+                if not self._dirty:  # flushed by someone else meanwhile
+                    continue
+                self._dirty = False
+            self._write()
+
+    def flush(self) -> None:
+        """Writes pending changes now. Does nothing if nothing is pending."""
+        with self._changed:
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._write()
+
+    def _write(self) -> None:
+        """Compacts the journal: writes the full snapshot, then drops the journaled entries."""
+        # Serialize writers, so an older snapshot can never replace a newer one
+        with self._write_lock:
+            with qa_lock:
+                snapshot = self.snapshot()
+                self._rotate_journal()
+            # Entries put from here on go to a fresh journal and survive this compaction
+            if save_qa_data(self.file_path, snapshot):
+                try:
+                    os.remove(self.rotated_journal_path)
+                except FileNotFoundError:
+                    pass
+
+    def _rotate_journal(self) -> None:
+        """Moves the live journal aside. Caller must hold ``qa_lock``."""
+        if not self.journal_path.exists():
+            return
+        if self.rotated_journal_path.exists():
+            # A previous compaction failed; keep its entries ahead of the new ones
+            with open(self.rotated_journal_path, "ab") as dst, open(self.journal_path, "rb") as src:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self.rotated_journal_path)
+
+
+qa_store = QAStore(qa_file_path)
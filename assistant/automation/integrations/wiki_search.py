@@ -1,12 +1,7 @@
 from datetime import datetime
 import wikipedia
 from assistant.core.speak_selector import speak
-from assistant.automation.features.save_data_locally import (
-    qa_lock,
-    qa_file_path,
-    qa_dict,
-    save_qa_data,
-)
+from assistant.automation.features.save_data_locally import qa_store
 
 
 # Cache for Wikipedia results to avoid repeated API calls and reduce latency
@@ -127,9 +122,7 @@ def wiki_search(prompt: str, use_cache: bool = True) -> None:
         speak(wiki_summary)
 
         # Save to persistent Q&A database for future learning
-        with qa_lock:  # Ensure thread-safe access to shared Q&A dictionary
-            qa_dict[search_prompt] = wiki_summary
-            save_qa_data(qa_file_path, qa_dict)
+        qa_store.put(search_prompt, wiki_summary)
 
     except wikipedia.exceptions.PageError:
         """
@@ -18,12 +18,7 @@ import sys
 from assistant.LLM.model import mind
 from assistant.activities.activity_monitor import record_user_activity
 from assistant.LLM.llm_search import llm_response_streaming
-from assistant.automation.features.save_data_locally import (
-    qa_lock,
-    qa_file_path,
-    qa_dict,
-    save_qa_data,
-)
+from assistant.automation.features.save_data_locally import qa_store
 
 
 def brain(text: str, threshold: float = 0.85) -> None:
@@ -56,8 +51,8 @@ def brain(text: str, threshold: float = 0.85) -> None:
         record_user_activity()
 
         # Check if query exists in local Q&A database for instant response
-        if text in qa_dict:
-            response = qa_dict[text]
+        response = qa_store.get(text)
+        if response is not None:
             from assistant.core.speak_selector import speak_streaming
             from assistant.core.llm_utils import split_sentences
             speak_streaming(split_sentences(response))
@@ -90,9 +85,7 @@ def brain(text: str, threshold: float = 0.85) -> None:
         # Store the new Q&A pair in local database for future use (e.g., from RAG)
         from assistant.core.llm_utils import should_cache_offline
         if should_cache_offline(text, response):
-            with qa_lock:  # Ensure thread-safe database operations
-                qa_dict[text] = response
-                save_qa_data(qa_file_path, qa_dict)
+            qa_store.put(text, response)
 
     except Exception:
         # Handle any processing errors gracefully
@@ -0,0 +1,32 @@
+"""
+Module for fast JSON file loading.
+Provides an orjson reader that memory-maps large files instead of copying them into memory.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Union
+
+import orjson
+
+# Files above this size are memory-mapped instead of read into a bytes copy;
+# below it a plain read is cheaper than setting up the mapping
+_MMAP_THRESHOLD = 1024 * 1024
+
+
+def read_json_file(file_path: Union[str, Path]) -> Any:
+    """
+    Parses a JSON file with orjson, memory-mapping it when it is large.
+
+    Args:
+        file_path: Path to the JSON file.
+
+    Returns:
+        The decoded JSON value.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
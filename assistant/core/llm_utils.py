@@ -10,12 +10,7 @@ import markdown
 from bs4 import BeautifulSoup
 import strip_markdown
 from typing import List, Dict
-from assistant.automation.features.save_data_locally import (
-    qa_lock,
-    qa_file_path,
-    qa_dict,
-    save_qa_data,
-)
+from assistant.automation.features.save_data_locally import qa_store
 from num2words import num2words as _num2words
 
 def clean_llm_output(raw_text: str) -> str:
@@ -555,6 +550,4 @@ def save_to_brain(query: str, answer: str) -> None:
     if not should_cache_offline(query, answer):
         return
         
-    with qa_lock:
-        qa_dict[query] = answer
-        save_qa_data(qa_file_path, qa_dict)
+    qa_store.put(query, answer)
@@ -0,0 +1,35 @@
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from assistant.LLM.model import _best_match
+
+CORPUS = ["weather today", "play music", "weather today", "tell joke"]
+
+def _check_against_cosine(X, question_vec):
+    expected_row = int(cosine_similarity(question_vec, X).argmax())
+    expected_score = float(cosine_similarity(question_vec, X)[0, expected_row])
+    row, score = _best_match(question_vec, X)
+    assert row == expected_row
+    assert abs(score - expected_score) < 1e-9
+
+def test_best_match_matches_cosine_similarity():
+    vectorizer = TfidfVectorizer()
+    X = vectorizer.fit_transform(CORPUS)
+
+    # CSR is what fit_transform returns; CSC is the layout the JIT kernel uses
+    for matrix in (X.tocsr(), X.tocsc()):
+        # Rows 0 and 2 tie; the earliest row wins, as with argmax
+        tied = vectorizer.transform(["weather today"])
+        _check_against_cosine(matrix, tied)
+        assert _best_match(tied, matrix)[0] == 0
+
+        _check_against_cosine(matrix, vectorizer.transform(["play some music"]))
+
+def test_best_match_without_overlap():
+    vectorizer = TfidfVectorizer()
+    X = vectorizer.fit_transform(CORPUS)
+
+    for matrix in (X.tocsr(), X.tocsc()):
+        no_overlap = vectorizer.transform(["quantum physics"])
+        _check_against_cosine(matrix, no_overlap)
+        assert _best_match(no_overlap, matrix) == (0, 0.0)
@@ -0,0 +1,14 @@
+from assistant.automation.app_control.open import _closest_site
+
+def test_closest_site_typos():
+    # Misspelled names resolve to the intended website
+    assert _closest_site("gogle") == "google"
+    assert _closest_site("youtub") == "youtube"
+    assert _closest_site("wikipeda") == "wikipedia"
+
+    # Typos sharing trigrams only with other names still reach the right one
+    assert _closest_site("cava") == "canva"
+    assert _closest_site("nara") == "nasa"
+
+def test_closest_site_no_match():
+    assert _closest_site("xyzzyq") is None
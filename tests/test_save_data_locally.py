@@ -0,0 +1,66 @@
+import orjson
+
+from assistant.automation.features import save_data_locally
+from assistant.automation.features.save_data_locally import (
+    QAStore,
+    append_qa_journal,
+    replay_qa_journal
+)
+
+def test_put_is_replayed_after_restart(tmp_path):
+    qa_file = tmp_path / "qna_data.json"
+    store = QAStore(qa_file, delay=60)
+    store.put("who made you?", "Arnab")
+
+    # The entry is only in the journal until the next compaction
+    assert store.journal_path.exists()
+
+    restarted = QAStore(qa_file, delay=60)
+    assert restarted.get("who made you?") == "Arnab"
+
+    store.flush()
+    restarted.flush()
+    assert not store.journal_path.exists()
+    assert orjson.loads(qa_file.read_bytes())["who made you?"] == "Arnab"
+
+def test_failed_compaction_keeps_rotated_journal(tmp_path, monkeypatch):
+    qa_file = tmp_path / "qna_data.json"
+    store = QAStore(qa_file, delay=60)
+    store.snapshot()
+
+    monkeypatch.setattr(save_data_locally, "save_qa_data", lambda path, data: False)
+    store.put("first", "1")
+    store.flush()
+    assert store.rotated_journal_path.exists()
+    assert not store.journal_path.exists()
+
+    # The next rotation appends to the leftover journal instead of replacing it
+    store.put("second", "2")
+    store.flush()
+    lines = store.rotated_journal_path.read_bytes().splitlines()
+    assert [orjson.loads(line)["q"] for line in lines] == ["first", "second"]
+
+    restarted = QAStore(qa_file, delay=60)
+    assert restarted.get("first") == "1"
+    assert restarted.get("second") == "2"
+
+    monkeypatch.undo()
+    restarted.flush()
+    assert not store.rotated_journal_path.exists()
+    saved = orjson.loads(qa_file.read_bytes())
+    assert saved["first"] == "1"
+    assert saved["second"] == "2"
+
+def test_torn_journal_line_is_skipped(tmp_path):
+    journal = tmp_path / "qna_data.jsonl"
+    journal.write_bytes(b'{"q":"hello","a":"hi"}\n{"q":"bye","a')
+
+    qa_dict = {}
+    assert replay_qa_journal(journal, qa_dict) == 1
+    assert qa_dict == {"hello": "hi"}
+
+    # Appending after the torn tail keeps the new entry on its own line
+    append_qa_journal(journal, "thanks", "welcome")
+    qa_dict = {}
+    assert replay_qa_journal(journal, qa_dict) == 2
+    assert qa_dict == {"hello": "hi", "thanks": "welcome"}